@@ -1,6 +1,6 @@
 import argparse
 import sys
-from utils.git import GitManager
+from utils.git import GitManager, LockTimeout
 from utils.api import GitHubAPI, AIService
 from controllers import CommitController, ProfileController
 from components.profile_view import ProfileView
@@ -38,6 +38,14 @@ class GLIApp:
         parser.add_argument("-ac", "--ai-commit", action="store_true", help="AI-powered commit")
         parser.add_argument("-l", "--log", action="store_true", help="View git log")
         parser.add_argument("-rl", "--reflog", action="store_true", help="View git reflog")
+        parser.add_argument("-n", "--count", type=int, default=10, metavar="N", help="Log/Reflog: Entries to show (0 = all)")
+        parser.add_argument("-p", "--pager", action="store_true", help="Log/Reflog: Open in pager")
+        parser.add_argument("--grep", metavar="PATTERN", help="Reflog: Match operation message (regex)")
+        parser.add_argument("--since", metavar="DATE", help="Reflog: Entries at or after DATE")
+        parser.add_argument("--until", metavar="DATE", help="Reflog: Entries at or before DATE")
+        parser.add_argument("--op", metavar="OPERATION", help="Reflog: Operation type (commit, reset, checkout...)")
+        parser.add_argument("--ref", default="HEAD", metavar="REF", help="Reflog: HEAD or a branch name")
+        parser.add_argument("--restore", nargs="?", const="prompt", metavar="SELECTOR", help="Reflog: Restore an entry")
         parser.add_argument("-rs", "--reset", choices=["soft", "hard"], help="Reset last commit")
         parser.add_argument("-s", "--switch", metavar="BRANCH", help="Branch management")
         parser.add_argument("-ct", "--changeTime", nargs="?", const="", metavar="DATE", help="History: Change time")
@@ -63,10 +71,16 @@ class GLIApp:
             self.commit_ctrl.handle_ai_commit(no_verify=args.no_verify)
             
         elif args.log:
-            self.git.show_log()
+            self.git.show_log(args.count, pager=args.pager)
             
         elif args.reflog:
-            self.git.show_reflog()
+            if args.grep or args.since or args.until or args.op or args.restore or args.ref != "HEAD":
+                self.git.search_reflog(
+                    args.ref, grep=args.grep, since=args.since, until=args.until, op=args.op,
+                    count=args.count, restore=args.restore, pager=args.pager
+                )
+            else:
+                self.git.show_reflog(args.count, pager=args.pager)
             
         elif args.reset:
             self.git.reset_commit(args.reset)
@@ -104,3 +118,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n\x1b[31mOperation cancelled.\x1b[0m")
         sys.exit(0)
+    except LockTimeout as e:
+        print(f"\x1b[31m✗ Error:\x1b[0m {e}")
+        sys.exit(1)
@@ -0,0 +1,11 @@
+"""
+Offline benchmark harness for the gli command paths.
+
+Builds synthetic repositories, stands up local stand-ins for the AI commit
+endpoint and ``api.github.com``, and times every ``GLIApp`` route.
+Run with ``python -m benchmarks --help`` from the repository root.
+"""
+
+from .synthetic_repo import SyntheticRepo
+from .stub_servers import StubServer, AIStubServer, GitHubStubServer
+from .runner import BenchmarkRunner, BenchmarkCase
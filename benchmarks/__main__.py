@@ -0,0 +1,84 @@
+import argparse
+import os
+import shutil
+import sys
+
+from rich.console import Console
+
+from .synthetic_repo import SyntheticRepo
+from .runner import BenchmarkRunner, default_cases, select_cases, compare, load, save
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def main() -> int:
+    """
+    Parse benchmark options, run the selected cases, and compare against a baseline.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="gli offline benchmarks")
+    parser.add_argument("--commits", type=int, default=100, help="Commits in the synthetic repository")
+    parser.add_argument("--files", type=int, default=20, help="Tracked files in the synthetic repository")
+    parser.add_argument("--file-lines", type=int, default=200, help="Lines per tracked file")
+    parser.add_argument("--diff-lines", type=int, default=20, help="Lines changed per commit / working tree edit")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for repository content")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--cases", metavar="PATTERNS", help="Comma-separated case names, globs or tags")
+    parser.add_argument("--list", action="store_true", help="List available cases and exit")
+    parser.add_argument("--width", type=int, default=120, help="Console width used for rendering")
+    parser.add_argument("--ai-latency", type=float, default=0.0, metavar="MS", help="Artificial AI stub latency")
+    parser.add_argument("--github-latency", type=float, default=0.0, metavar="MS", help="Artificial GitHub stub latency")
+    parser.add_argument("--output", default=os.path.join(HERE, "results", "latest.json"), help="Results JSON path")
+    parser.add_argument("--baseline", default=os.path.join(HERE, "baseline.json"), help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative median slowdown counted as regression")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch directory for inspection")
+    args = parser.parse_args()
+
+    console = Console()
+    cases = select_cases(default_cases(), args.cases)
+    if args.list:
+        for case in cases:
+            console.print(f"[bold green]{case.name:<24}[/] gli {' '.join(case.argv):<32} [dim]{', '.join(case.tags)}[/]")
+        return 0
+    if not cases:
+        console.print("[bold red]✗ Error:[/] No benchmark cases matched.")
+        return 2
+
+    root = SyntheticRepo.make_root()
+    repo = SyntheticRepo(root, commits=args.commits, files=args.files, file_lines=args.file_lines,
+                         diff_lines=args.diff_lines, seed=args.seed)
+    runner = BenchmarkRunner(repo, repeat=args.repeat, width=args.width, ai_latency_ms=args.ai_latency,
+                             github_latency_ms=args.github_latency, console=console)
+    try:
+        document = runner.run(cases)
+    finally:
+        if args.keep:
+            console.print(f"[dim]Scratch directory kept at {root}[/]")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    save(document, args.output)
+    console.print(f"[dim]Results written to {args.output}[/]")
+
+    failed = [name for name, result in document["results"].items() if result["errors"]]
+    for name in failed:
+        console.print(f"[bold red]✗ Error:[/] {name}: {'; '.join(document['results'][name]['errors'])}")
+
+    if args.save_baseline:
+        save(document, args.baseline)
+        console.print(f"[bold green]Baseline stored at {args.baseline}[/]")
+        return 1 if failed else 0
+
+    baseline = load(args.baseline)
+    if baseline is None:
+        console.print("[bold yellow]⚠ Info:[/] No baseline found; run with --save-baseline to record one.")
+        return 1 if failed else 0
+
+    regressions = compare(document, baseline, args.threshold, console)
+    if regressions:
+        console.print(f"[bold red]Regressed:[/] {', '.join(regressions)}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+import builtins
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from .synthetic_repo import SyntheticRepo
+from .stub_servers import AIStubServer, GitHubStubServer
+
+SPECIFIC_REV = "HEAD~5"
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    A single ``GLIApp`` invocation: argv, scripted answers for ``input()``, and
+    whether it mutates the repository (mutating cases get a fresh copy per run).
+    """
+    name: str
+    argv: List[str]
+    inputs: Callable[[str], List[str]] = lambda work: []
+    mutates: bool = False
+    dirty: bool = False
+    tags: List[str] = field(default_factory=list)
+
+
+def _scoped(scope: str, *rest: str) -> Callable[[str], List[str]]:
+    """
+    Build the ``input()`` script for a history command in a given scope.
+    The specific scope resolves its target hash once the working copy exists.
+    """
+    choice = {"single": "1", "specific": "2", "all": "3"}[scope]
+
+    def answers(work: str) -> List[str]:
+        head = [choice]
+        if scope == "specific":
+            rev = subprocess.check_output(["git", "rev-parse", SPECIFIC_REV], cwd=work)
+            head.append(rev.decode("utf-8").strip()[:12])
+        return head + list(rest)
+
+    return answers
+
+
+def default_cases() -> List[BenchmarkCase]:
+    """
+    Every command route exposed by ``GLIApp.run``.
+    """
+    cases = [
+        BenchmarkCase("help", [], tags=["view"]),
+        BenchmarkCase("log", ["-l"], tags=["log"]),
+        BenchmarkCase("reflog", ["-rl"], tags=["log"]),
+        BenchmarkCase("log-all", ["-l", "-n", "0"], tags=["log"]),
+        BenchmarkCase("reflog-all", ["-rl", "-n", "0"], tags=["log"]),
+        BenchmarkCase("reflog-grep", ["-rl", "--grep", "file_00003"], tags=["log", "reflog"]),
+        BenchmarkCase("reflog-op", ["-rl", "--op", "reset", "-n", "0"], tags=["log", "reflog"]),
+        BenchmarkCase("reflog-since", ["-rl", "--since", "2023-11-20", "--until", "2023-11-25", "-n", "0"],
+                      tags=["log", "reflog"]),
+        BenchmarkCase("commit", ["-c", "bench: direct commit"], mutates=True, dirty=True, tags=["commit"]),
+        BenchmarkCase("commit-prompt", ["-c"], lambda work: ["bench: prompted commit"],
+                      mutates=True, dirty=True, tags=["commit"]),
+        BenchmarkCase("ai-commit", ["-ac"], lambda work: ["1"], mutates=True, dirty=True, tags=["commit", "api"]),
+        BenchmarkCase("reset-soft", ["-rs", "soft"], mutates=True, tags=["actions"]),
+        BenchmarkCase("reset-hard", ["-rs", "hard"], mutates=True, tags=["actions"]),
+        BenchmarkCase("switch-local", ["-s", "bench-branch", "-lb"], mutates=True, tags=["actions"]),
+        BenchmarkCase("switch-remote", ["-s", "bench-branch"], mutates=True, tags=["actions"]),
+        BenchmarkCase("change-message", ["-cm"], lambda work: ["bench: rewritten"], mutates=True, tags=["history"]),
+        BenchmarkCase("profile", ["profile", "octocat"], tags=["api"]),
+        BenchmarkCase("me", ["me"], tags=["api"]),
+    ]
+    for scope in ("single", "specific", "all"):
+        cases.append(BenchmarkCase(f"change-time-{scope}", ["-ct", "2024-01-01 12:00:00"],
+                                   _scoped(scope), mutates=True, tags=["history"]))
+        cases.append(BenchmarkCase(f"change-author-{scope}", ["-ca"],
+                                   _scoped(scope, "Bench Author", "author@example.com"),
+                                   mutates=True, tags=["history"]))
+    return cases
+
+
+class BenchmarkRunner:
+    """
+    Time ``GLIApp`` command paths against a synthetic repository and local API stubs.
+    """
+
+    def __init__(self, repo: SyntheticRepo, repeat: int = 5, width: int = 120,
+                 ai_latency_ms: float = 0.0, github_latency_ms: float = 0.0,
+                 console: Optional[Console] = None):
+        self.repo = repo
+        self.repeat = max(1, repeat)
+        self.width = width
+        self.ai_latency_ms = ai_latency_ms
+        self.github_latency_ms = github_latency_ms
+        self.console = console or Console()
+
+    def _make_app(self, ai: AIStubServer, github: GitHubStubServer, output: io.StringIO):
+        """
+        Build a ``GLIApp`` wired to the stubs, rendering into ``output``.
+        """
+        from app import GLIApp
+
+        app = GLIApp()
+        sink = Console(file=output, width=self.width)
+        app.git.console = sink
+        app.profile_view.console = sink
+        app.help_view.console = sink
+        app.ai_service._get_api_url = lambda: ai.endpoint
+        app.github_api.BASE_URL = github.users_url
+        return app
+
+    @contextlib.contextmanager
+    def _scripted_input(self, answers: List[str]):
+        """Replace ``input()`` with a fixed script of answers."""
+        queue = list(answers)
+        original = builtins.input
+
+        def fake_input(prompt: str = "") -> str:
+            if not queue:
+                raise RuntimeError(f"benchmark ran out of scripted input at prompt {prompt!r}")
+            return queue.pop(0)
+
+        builtins.input = fake_input
+        try:
+            yield
+        finally:
+            builtins.input = original
+
+    def _run_once(self, case: BenchmarkCase, work: str, ai: AIStubServer,
+                  github: GitHubStubServer) -> Dict[str, object]:
+        """
+        Execute a case once inside ``work`` and return its wall time and outcome.
+        """
+        output = io.StringIO()
+        app = self._make_app(ai, github, output)
+        answers = case.inputs(work)
+        previous_cwd, previous_argv = os.getcwd(), sys.argv
+        os.chdir(work)
+        sys.argv = ["gli"] + case.argv
+        error = None
+        try:
+            with self._scripted_input(answers), contextlib.redirect_stdout(output):
+                start = time.perf_counter()
+                try:
+                    app.run()
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(previous_cwd)
+            sys.argv = previous_argv
+
+        rendered = output.getvalue()
+        if error is None and "Error:" in rendered:
+            error = rendered[rendered.index("Error:"):].splitlines()[0]
+        return {"seconds": elapsed, "error": error}
+
+    def run(self, cases: List[BenchmarkCase]) -> Dict[str, object]:
+        """
+        Run every case ``repeat`` times and return the results document.
+        """
+        results: Dict[str, Dict[str, object]] = {}
+        template_work = self.repo.build()
+
+        with AIStubServer(self.ai_latency_ms) as ai, GitHubStubServer(self.github_latency_ms) as github:
+            for case in cases:
+                timings: List[float] = []
+                errors: List[str] = []
+                for i in range(self.repeat):
+                    if case.mutates:
+                        dest = os.path.join(self.repo.root, f"run-{case.name}-{i}")
+                        work = self.repo.clone_to(dest)
+                    else:
+                        dest, work = None, template_work
+                    if case.dirty:
+                        self.repo.dirty(work, seed=i)
+
+                    outcome = self._run_once(case, work, ai, github)
+                    timings.append(outcome["seconds"])
+                    if outcome["error"]:
+                        errors.append(outcome["error"])
+                    if dest:
+                        shutil.rmtree(dest, ignore_errors=True)
+
+                results[case.name] = {
+                    "argv": case.argv,
+                    "tags": case.tags,
+                    "runs": len(timings),
+                    "min": min(timings),
+                    "median": statistics.median(timings),
+                    "mean": statistics.fmean(timings),
+                    "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                    "max": max(timings),
+                    "errors": sorted(set(errors)),
+                }
+                status = "[bold red]✗[/]" if errors else "[bold green]✓[/]"
+                self.console.print(f"{status} {case.name:<24} median {results[case.name]['median'] * 1000:9.1f} ms")
+
+            requests = {"ai": ai.requests, "github": github.requests}
+
+        return {"meta": self._meta(requests), "results": results}
+
+    def _meta(self, requests: Dict[str, int]) -> Dict[str, object]:
+        """Describe the environment and inputs that produced a results document."""
+        git_version = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout.strip()
+        return {
+            "repo": self.repo.params,
+            "repeat": self.repeat,
+            "width": self.width,
+            "ai_latency_ms": self.ai_latency_ms,
+            "github_latency_ms": self.github_latency_ms,
+            "stub_requests": requests,
+            "python": platform.python_version(),
+            "git": git_version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+
+
+def select_cases(cases: List[BenchmarkCase], patterns: Optional[str]) -> List[BenchmarkCase]:
+    """
+    Filter cases by comma-separated glob patterns matched against names and tags.
+    """
+    if not patterns:
+        return cases
+    wanted = [p.strip() for p in patterns.split(",") if p.strip()]
+    return [c for c in cases
+            if any(fnmatch.fnmatch(c.name, p) or p in c.tags for p in wanted)]
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float,
+            console: Console) -> List[str]:
+    """
+    Render a comparison of medians against a baseline and return the regressed case names.
+    """
+    table = Table(title="Benchmark Comparison", box=box.ROUNDED, border_style="green")
+    table.add_column("Case", style="white", no_wrap=True)
+    table.add_column("Baseline", style="dim", justify="right")
+    table.add_column("Current", style="white", justify="right")
+    table.add_column("Delta", justify="right")
+
+    if baseline.get("meta", {}).get("repo") != current["meta"]["repo"]:
+        console.print("[bold yellow]⚠ Info:[/] Baseline was recorded with different repository parameters.")
+
+    regressions: List[str] = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median"):
+            table.add_row(name, "-", f"{result['median'] * 1000:.1f} ms", "[dim]new[/]")
+            continue
+        delta = (result["median"] - base["median"]) / base["median"]
+        if delta > threshold:
+            regressions.append(name)
+            style = "bold red"
+        elif delta < -threshold:
+            style = "bold green"
+        else:
+            style = "dim"
+        table.add_row(name, f"{base['median'] * 1000:.1f} ms", f"{result['median'] * 1000:.1f} ms",
+                      f"[{style}]{delta:+.1%}[/]")
+
+    console.print(table)
+    return regressions
+
+
+def load(path: str) -> Optional[Dict[str, object]]:
+    """Read a results document, or return None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save(document: Dict[str, object], path: str) -> None:
+    """Write a results document as indented JSON."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+        handle.write("\n")
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+
+class StubServer:
+    """
+    Minimal threaded HTTP server bound to an ephemeral localhost port.
+
+    Subclasses implement ``handle`` and return ``(status, payload)``; the
+    payload is served as JSON after an optional artificial latency.
+    """
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        raise NotImplementedError
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                with stub._lock:
+                    stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                status, payload = stub.handle(method, self.path, body)
+                raw = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubServer":
+        """Start serving in a daemon thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and release the port."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class AIStubServer(StubServer):
+    """
+    Stand-in for the AI commit endpoint. Echoes a message sized to the submitted diff.
+    """
+
+    PATH = "/api/v2/commit"
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.url}{self.PATH}"
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if method != "POST" or path != self.PATH:
+            return 404, {"error": "not found"}
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"error": "invalid json"}
+        diff = payload.get("gitDiff", "")
+        files = diff.count("diff --git")
+        return 200, {"data": {"commitMessage": f"chore: update {files} files ({len(diff)} bytes)"}}
+
+
+class GitHubStubServer(StubServer):
+    """
+    Stand-in for the ``api.github.com`` user endpoints used by the profile view.
+    """
+
+    @property
+    def users_url(self) -> str:
+        return f"{self.url}/users/"
+
+    def _user(self, username: str) -> Dict[str, Any]:
+        return {
+            "login": username,
+            "name": f"{username.title()} Bench",
+            "bio": "Synthetic profile served by the gli benchmark harness.",
+            "public_repos": 42,
+            "followers": 1337,
+            "following": 7,
+            "location": "Localhost",
+            "twitter_username": username,
+            "blog": "https://example.com",
+            "created_at": "2020-01-01T00:00:00Z",
+        }
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        parts = [p for p in path.split("?")[0].split("/") if p]
+        if method != "GET" or len(parts) < 2 or parts[0] != "users":
+            return 404, {"message": "Not Found"}
+        if len(parts) == 3 and parts[2] == "repos":
+            return 200, [{"name": f"repo-{i}", "stargazers_count": i} for i in range(5)]
+        return 200, self._user(parts[1])
@@ -0,0 +1,176 @@
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+AUTHOR = "Bench User <bench@example.com>"
+BASE_TIMESTAMP = 1700000000
+
+
+class SyntheticRepo:
+    """
+    Deterministic generator for benchmark repositories with a local bare remote.
+
+    History is written through ``git fast-import`` so even large repositories
+    build in seconds, and a matching reflog is emitted for every commit.
+    """
+
+    def __init__(self, root: str, commits: int = 100, files: int = 20,
+                 file_lines: int = 200, diff_lines: int = 20, seed: int = 0):
+        self.root = root
+        self.commits = max(1, commits)
+        self.files = max(1, files)
+        self.file_lines = max(1, file_lines)
+        self.diff_lines = max(1, min(diff_lines, file_lines))
+        self.seed = seed
+        self.template = os.path.join(root, "template")
+
+    @property
+    def params(self) -> Dict[str, int]:
+        """Return the generation parameters, recorded alongside results."""
+        return {
+            "commits": self.commits,
+            "files": self.files,
+            "file_lines": self.file_lines,
+            "diff_lines": self.diff_lines,
+            "seed": self.seed,
+        }
+
+    def _git(self, args: List[str], cwd: str, data: Optional[bytes] = None,
+             env: Optional[Dict[str, str]] = None) -> str:
+        """Run a git command for setup purposes, raising on failure."""
+        current_env = os.environ.copy()
+        if env:
+            current_env.update(env)
+        result = subprocess.run(["git"] + args, cwd=cwd, input=data, capture_output=True,
+                                check=True, env=current_env)
+        return result.stdout.decode("utf-8").strip()
+
+    def _line(self, rng: random.Random, index: int) -> str:
+        return f"line {index:06d} {rng.getrandbits(64):016x}\n"
+
+    def _file_path(self, index: int) -> str:
+        return f"src/module_{index // 10:03d}/file_{index:05d}.txt"
+
+    def _fast_import_stream(self) -> Tuple[bytes, List[str]]:
+        """
+        Build the fast-import stream and the list of commit subjects.
+        """
+        rng = random.Random(self.seed)
+        contents = [[self._line(rng, i) for i in range(self.file_lines)] for _ in range(self.files)]
+        chunks: List[bytes] = []
+        subjects: List[str] = []
+
+        def data(payload: str) -> None:
+            raw = payload.encode("utf-8")
+            chunks.append(f"data {len(raw)}\n".encode("utf-8") + raw + b"\n")
+
+        for n in range(1, self.commits + 1):
+            ts = BASE_TIMESTAMP + n * 3600
+            if n == 1:
+                touched = list(range(self.files))
+                subject = "chore: initial import"
+            else:
+                target = (n - 2) % self.files
+                for i in rng.sample(range(self.file_lines), self.diff_lines):
+                    contents[target][i] = self._line(rng, i)
+                touched = [target]
+                subject = f"feat: update {self._file_path(target)} (#{n})"
+            subjects.append(subject)
+
+            chunks.append(f"commit refs/heads/main\nmark :{n}\n".encode("utf-8"))
+            chunks.append(f"author {AUTHOR} {ts} +0000\ncommitter {AUTHOR} {ts} +0000\n".encode("utf-8"))
+            data(subject)
+            if n > 1:
+                chunks.append(f"from :{n - 1}\n".encode("utf-8"))
+            for index in touched:
+                chunks.append(f"M 100644 inline {self._file_path(index)}\n".encode("utf-8"))
+                data("".join(contents[index]))
+        chunks.append(b"done\n")
+        return b"".join(chunks), subjects
+
+    def _write_reflog(self, work: str, shas: List[str], subjects: List[str]) -> None:
+        """
+        Emit HEAD and branch reflogs matching the generated history.
+
+        Every tenth commit is followed by a no-op reset so the log carries
+        more than one operation type.
+        """
+        zero = "0" * 40
+        lines: List[str] = []
+        previous = zero
+        for n, (sha, subject) in enumerate(zip(shas, subjects), start=1):
+            ts = BASE_TIMESTAMP + n * 3600
+            op = "commit (initial)" if n == 1 else "commit"
+            lines.append(f"{previous} {sha} {AUTHOR} {ts} +0000\t{op}: {subject}\n")
+            if n % 10 == 0:
+                lines.append(f"{sha} {sha} {AUTHOR} {ts + 60} +0000\treset: moving to HEAD\n")
+            previous = sha
+
+        for name in ("HEAD", os.path.join("refs", "heads", "main")):
+            path = os.path.join(work, ".git", "logs", name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.writelines(lines)
+
+    def build(self) -> str:
+        """
+        Create the template working copy and its bare remote. Returns the working copy path.
+        """
+        work = os.path.join(self.template, "work")
+        remote = os.path.join(self.template, "remote.git")
+        os.makedirs(work)
+        self._git(["init", "-q", "-b", "main", work], cwd=self.root)
+        self._git(["init", "-q", "--bare", "-b", "main", remote], cwd=self.root)
+
+        for key, value in (("user.name", "Bench User"), ("user.email", "bench@example.com"),
+                           ("github.user", "bench-user"), ("commit.gpgsign", "false"),
+                           ("core.hooksPath", os.devnull)):
+            self._git(["config", key, value], cwd=work)
+
+        stream, subjects = self._fast_import_stream()
+        marks = os.path.join(self.root, "marks")
+        self._git(["fast-import", "--quiet", f"--export-marks={marks}"], cwd=work, data=stream)
+        self._git(["reset", "-q", "--hard", "main"], cwd=work)
+
+        with open(marks, encoding="utf-8") as handle:
+            pairs = dict(line.split() for line in handle if line.strip())
+        shas = [pairs[f":{n}"] for n in range(1, self.commits + 1)]
+        self._write_reflog(work, shas, subjects)
+
+        self._git(["remote", "add", "origin", f"file://{remote}"], cwd=work)
+        self._git(["push", "-q", "-u", "origin", "main"], cwd=work)
+        return work
+
+    def clone_to(self, dest: str) -> str:
+        """
+        Copy the template (working copy and remote) to ``dest`` and return the working copy path.
+        """
+        shutil.copytree(self.template, dest, symlinks=True)
+        work = os.path.join(dest, "work")
+        self._git(["remote", "set-url", "origin", f"file://{os.path.join(dest, 'remote.git')}"], cwd=work)
+        return work
+
+    def dirty(self, work: str, files: int = 3, seed: int = 0) -> None:
+        """
+        Modify ``diff_lines`` lines in a few tracked files and add one untracked file.
+        """
+        rng = random.Random(self.seed + seed + 1)
+        for index in rng.sample(range(self.files), min(files, self.files)):
+            path = os.path.join(work, self._file_path(index))
+            with open(path, encoding="utf-8") as handle:
+                lines = handle.readlines()
+            for i in rng.sample(range(len(lines)), min(self.diff_lines, len(lines))):
+                lines[i] = self._line(rng, i)
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.writelines(lines)
+
+        with open(os.path.join(work, f"bench_{seed}.txt"), "w", encoding="utf-8") as handle:
+            handle.writelines(self._line(rng, i) for i in range(self.diff_lines))
+
+    @staticmethod
+    def make_root() -> str:
+        """Create a scratch directory for a benchmark session."""
+        return tempfile.mkdtemp(prefix="gli-bench-")
@@ -45,6 +45,8 @@ class HelpView:
             ("AI Commit", "-ac, --ai-commit", "Generate AI message and push"),
             ("Log", "-l, --log", "View commit history graph"),
             ("Reflog", "-rl, --reflog", "View git reflog"),
+            ("Reflog Search", "--grep, --since, --until\n--op, --ref\n--restore", "Filter reflog (with -rl)\nBy operation / branch\nRestore a matched entry"),
+            ("Log Options", "-n, --count\n-p, --pager", "[-n] Entries to show (0 = all)\n[-p] Open in pager"),
             ("Reset", "-rs, --reset", "Reset last commit (soft/hard)"),
             ("Switch Branch", "-s, --switch\n-lb, --local-branch\n-rb, --remote-branch", "Create branch\n[-lb] Local only\n[-rb] Push remote"),
             ("Change Time", "-ct, --changeTime", "Update commit timestamp(s)"),
@@ -0,0 +1,189 @@
+import contextlib
+import os
+import shlex
+import subprocess
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from rich.cells import cell_len, set_cell_size
+from rich.console import Console
+from rich.segment import Segment, Segments
+from rich.style import Style
+from rich.text import Text
+from rich import box
+
+Column = Tuple[str, str, str, int]
+
+
+class _PagerConsole(Console):
+    """
+    Console writing into a pager's stdin. Rich's default reaction to a closed
+    pipe redirects ``sys.stdout`` to devnull and exits the process; here the
+    ``BrokenPipeError`` is raised so the caller can stop rendering and carry on.
+    """
+
+    def on_broken_pipe(self) -> None:
+        self.quiet = True
+        raise BrokenPipeError
+
+
+class LogView:
+    """
+    View component that renders large log tables without laying out every row.
+
+    Column widths are measured from a leading sample, the final column is fitted
+    to the terminal width, and rows are emitted in fixed-width chunks as they
+    arrive. Each column is ``(header, style, justify, max_width)``; a max width
+    of 0 means unbounded.
+    """
+
+    SAMPLE_SIZE = 200
+    CHUNK_SIZE = 100
+    MIN_FLEX_WIDTH = 10
+
+    def __init__(self, console: Console = None):
+        """Initialize the view with a Rich console."""
+        self.console = console or Console()
+
+    def _measure(self, columns: Sequence[Column], sample: List[Sequence[str]], width: int) -> List[int]:
+        """
+        Compute column widths from the sample so the table fits ``width``.
+
+        The last column shrinks first, down to ``MIN_FLEX_WIDTH``; after that the
+        widest of the other columns is narrowed, and only then the last column
+        again. Cells are truncated to whatever width they end up with.
+        """
+        widths = []
+        for i, (header, _, _, max_width) in enumerate(columns):
+            natural = max([cell_len(header)] + [cell_len(row[i]) for row in sample if i < len(row)])
+            widths.append(min(natural, max_width) if max_width else natural)
+
+        chrome = len(columns) + 1 + 2 * len(columns)
+        excess = sum(widths) + chrome - width
+        if excess <= 0:
+            return widths
+
+        flex_floor = min(widths[-1], self.MIN_FLEX_WIDTH)
+        shrink = min(excess, widths[-1] - flex_floor)
+        widths[-1] -= shrink
+        excess -= shrink
+
+        while excess > 0:
+            widest = max(range(len(widths) - 1), key=lambda i: widths[i], default=None)
+            if widest is None or widths[widest] <= 1:
+                break
+            widths[widest] -= 1
+            excess -= 1
+
+        if excess > 0:
+            widths[-1] = max(1, widths[-1] - excess)
+        return widths
+
+    def _fit(self, value: str, width: int, justify: str) -> str:
+        """
+        Pad or truncate a cell value to exactly ``width`` cells.
+        """
+        value = value.replace("\n", " ")
+        length = cell_len(value)
+        if length > width:
+            return set_cell_size(value, width - 1) + "…"
+        padding = " " * (width - length)
+        return padding + value if justify == "right" else value + padding
+
+    def _line(self, cells: Sequence[str], columns: Sequence[Column], widths: List[int],
+              styles: List[Style], border: Style, header: bool = False) -> List[Segment]:
+        """
+        Lay out one table row at the precomputed widths.
+        """
+        left, divider, right = (box.ROUNDED.head_left, box.ROUNDED.head_vertical, box.ROUNDED.head_right) if header \
+            else (box.ROUNDED.mid_left, box.ROUNDED.mid_vertical, box.ROUNDED.mid_right)
+        last = len(columns) - 1
+        line = [Segment(left, border)]
+        for i, (column, width, style) in enumerate(zip(columns, widths, styles)):
+            value = cells[i] if i < len(cells) else ""
+            line.append(Segment(f" {self._fit(value, width, column[2])} ", style))
+            line.append(Segment(right if i == last else divider, border))
+        line.append(Segment.line())
+        return line
+
+    def _chunks(self, rows: Iterator[Sequence[str]]) -> Iterator[List[Sequence[str]]]:
+        while True:
+            chunk = list(islice(rows, self.CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+
+    def _emit(self, console: Console, title: str, columns: Sequence[Column],
+              rows: Iterator[Sequence[str]], widths: List[int], border_style: str) -> int:
+        """
+        Write the title, header, streamed body and footer. Returns the number of rows written.
+        """
+        segments = [w + 2 for w in widths]
+        table_width = sum(segments) + len(segments) + 1
+        border = console.get_style(border_style)
+        styles = [console.get_style(c[1]) for c in columns]
+        header_styles = [console.get_style("bold")] * len(columns)
+
+        heading = Text(title, style="italic")
+        heading.truncate(table_width, overflow="ellipsis")
+        console.print(heading, width=table_width, justify="center", crop=True, no_wrap=True)
+        console.print(Segments(
+            [Segment(box.ROUNDED.get_top(segments), border), Segment.line()]
+            + self._line([c[0] for c in columns], columns, widths, header_styles, border, header=True)
+            + [Segment(box.ROUNDED.get_row(segments, "head"), border), Segment.line()]
+        ), end="")
+
+        count = 0
+        for chunk in self._chunks(rows):
+            body: List[Segment] = []
+            for row in chunk:
+                body.extend(self._line(row, columns, widths, styles, border))
+            console.print(Segments(body), end="")
+            count += len(chunk)
+
+        console.print(Segments([Segment(box.ROUNDED.get_bottom(segments), border), Segment.line()]), end="")
+        return count
+
+    @contextlib.contextmanager
+    def _pager_console(self) -> Iterator[Console]:
+        """
+        Yield a console that streams into ``$PAGER`` (``less`` by default).
+
+        The pager only lays out the visible window; when it exits early the
+        broken pipe ends rendering. Falls back to the regular console.
+        """
+        command = shlex.split(os.environ.get("PAGER") or "less -RFS")
+        try:
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, text=True, encoding="utf-8")
+        except OSError:
+            yield self.console
+            return
+
+        console = _PagerConsole(file=process.stdin, width=self.console.width,
+                                force_terminal=self.console.is_terminal, color_system=self.console.color_system)
+        try:
+            yield console
+        except BrokenPipeError:
+            pass
+        finally:
+            with contextlib.suppress(BrokenPipeError):
+                process.stdin.close()
+            process.wait()
+
+    def render(self, title: str, columns: Sequence[Column], rows: Iterable[Sequence[str]],
+               border_style: str = "green", pager: bool = False) -> int:
+        """
+        Render rows as a bordered table, streaming chunk by chunk. Returns the number of rows rendered.
+        """
+        rows = iter(rows)
+        sample = list(islice(rows, self.SAMPLE_SIZE))
+        widths = self._measure(columns, sample, self.console.width)
+        stream = chain(sample, rows)
+
+        if not pager:
+            return self._emit(self.console, title, columns, stream, widths, border_style)
+
+        count = 0
+        with self._pager_console() as console:
+            count = self._emit(console, title, columns, stream, widths, border_style)
+        return count
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from utils.git.lock import GitLock, LockTimeout
+
+
+class GitLockTest(unittest.TestCase):
+    """
+    Queue tickets and stale-ticket pruning.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "gli")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ticket_is_locked_as_soon_as_it_is_queued(self):
+        lock = GitLock(self.directory)
+        with lock:
+            tickets = os.listdir(lock.queue)
+            self.assertEqual(len(tickets), 1)
+            self.assertFalse(lock._is_stale(os.path.join(lock.queue, tickets[0])))
+            self.assertEqual([n for n in os.listdir(self.directory) if n.endswith(".tmp")], [])
+        self.assertEqual(os.listdir(lock.queue), [])
+
+    def test_stale_ticket_is_pruned(self):
+        lock = GitLock(self.directory)
+        os.makedirs(lock.queue)
+        stale = os.path.join(lock.queue, "00000000000000000001-1-dead")
+        open(stale, "w").close()
+        with lock:
+            self.assertFalse(os.path.exists(stale))
+
+    def test_live_ticket_ahead_blocks_until_timeout(self):
+        holder = GitLock(self.directory)
+        holder.acquire()
+        try:
+            waiter = GitLock(self.directory)
+            waiter._held = {}
+            waiter.timeout = 0.2
+            with self.assertRaises(LockTimeout):
+                waiter.acquire()
+            self.assertEqual(len(os.listdir(holder.queue)), 1)
+        finally:
+            holder.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import io
+import os
+import shlex
+import sys
+import unittest
+from unittest import mock
+
+from rich.cells import cell_len
+from rich.console import Console
+
+from components.log_view import LogView
+from utils.git.log import GitLog
+
+ROWS = [
+    ["HEAD@{0}", "06a250b", "2024-01-01 10:00", "commit: a somewhat longer message here"],
+    ["HEAD@{1}", "37045d3", "2024-01-01 09:00", "reset: moving to HEAD~1"],
+]
+
+
+class LogViewTest(unittest.TestCase):
+    """
+    Table layout at different terminal widths.
+    """
+
+    def _render(self, width: int, rows=ROWS) -> list:
+        console = Console(file=io.StringIO(), width=width, color_system=None)
+        LogView(console).render("Reflog", GitLog.REFLOG_COLUMNS, rows)
+        return console.file.getvalue().splitlines()
+
+    def test_table_fits_narrow_terminals(self):
+        for width in (80, 50, 30, 20):
+            lines = self._render(width)
+            self.assertTrue(all(cell_len(line) <= width for line in lines), width)
+            self.assertTrue(lines[1].endswith("╮") and lines[-1].endswith("╯"), width)
+            self.assertEqual(lines[1].count("┬"), 3, width)
+
+    def test_short_message_column_is_not_padded(self):
+        rows = [["HEAD@{0}", "06a250b", "2024-01-01 10:00", "ok"]]
+        header = self._render(120, rows)[2]
+        self.assertTrue(header.endswith("│ Operation │"))
+
+    def test_pager_quitting_early_stops_rendering(self):
+        reader = f"{shlex.quote(sys.executable)} -c 'import sys; sys.stdin.readline()'"
+        rows = (["HEAD@{%d}" % i, "06a250b", "2024-01-01 10:00", "commit: message"] for i in range(20000))
+        console = Console(file=io.StringIO(), width=80, color_system=None)
+        with mock.patch.dict(os.environ, {"PAGER": reader}):
+            shown = LogView(console).render("Reflog", GitLog.REFLOG_COLUMNS, rows, pager=True)
+        self.assertLess(shown, 20000)
+        self.assertEqual(console.file.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
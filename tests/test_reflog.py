@@ -0,0 +1,211 @@
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from rich.console import Console
+
+from utils.git import GitManager
+from utils.git.reflog import ReflogIndex
+
+ZERO = "0" * 40
+IDENTITY = "Test User <test@example.com>"
+
+
+def _sha(n: int) -> str:
+    return f"{n:040x}"
+
+
+def _line(n: int, ts: int, message: str) -> str:
+    return f"{_sha(n - 1) if n else ZERO} {_sha(n)} {IDENTITY} {ts} +0000\t{message}\n"
+
+
+# 2024-01-01 .. 2024-01-05 00:00 UTC, with one entry amended back to 2020-01-01.
+JAN_2024 = 1704067200
+DAY = 86400
+OLD = 1577836800
+
+
+class ReflogIndexTest(unittest.TestCase):
+    """
+    Index ordering and postings over hand-written reflog files.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.tmp.name, "HEAD")
+        self.index_path = os.path.join(self.tmp.name, "index.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, lines, mode="w"):
+        with open(self.log, mode, encoding="utf-8") as handle:
+            handle.writelines(lines)
+
+    def _index(self) -> ReflogIndex:
+        index = ReflogIndex(self.index_path)
+        index.refresh("HEAD", self.log)
+        index.save()
+        return index
+
+    def _stamps(self, index, **filters):
+        return [entry[0] for entry in index.candidates("HEAD", **filters)]
+
+    def test_out_of_order_timestamps_on_fresh_build(self):
+        self._write([
+            _line(0, JAN_2024, "commit (initial): a"),
+            _line(1, JAN_2024 + DAY, "commit: b"),
+            _line(2, OLD, "commit (amend): b"),
+            _line(3, JAN_2024 + 2 * DAY, "reset: moving to HEAD~1"),
+        ])
+        index = self._index()
+
+        self.assertEqual(self._stamps(index, since=JAN_2024 - DAY), [JAN_2024 + 2 * DAY, JAN_2024 + DAY, JAN_2024])
+        self.assertEqual(self._stamps(index, until=OLD + DAY), [OLD])
+
+    def test_out_of_order_timestamps_in_incremental_batch(self):
+        self._write([_line(0, JAN_2024, "commit (initial): a")])
+        self._index()
+        self._write([
+            _line(1, JAN_2024 + 2 * DAY, "commit: b"),
+            _line(2, OLD, "commit (amend): b"),
+            _line(3, JAN_2024 + DAY, "reset: moving to HEAD~1"),
+        ], mode="a")
+        index = self._index()
+
+        self.assertEqual(self._stamps(index), [JAN_2024 + 2 * DAY, JAN_2024 + DAY, JAN_2024, OLD])
+        self.assertEqual(self._stamps(index, until=OLD + DAY), [OLD])
+        self.assertEqual(self._stamps(index, op="commit", since=JAN_2024), [JAN_2024 + 2 * DAY, JAN_2024])
+        self.assertEqual(self._stamps(index, op="reset"), [JAN_2024 + DAY])
+
+    def test_postings_are_persisted_and_extended(self):
+        self._write([_line(0, JAN_2024, "commit (initial): a"), _line(1, JAN_2024 + DAY, "reset: moving to HEAD")])
+        self._index()
+        self._write([_line(2, JAN_2024 + 2 * DAY, "commit: b")], mode="a")
+        self._index()
+
+        reloaded = ReflogIndex(self.index_path)
+        state = reloaded.logs["HEAD"]
+        self.assertEqual(dict(zip(state["ops"], state["postings"])),
+                         {"commit (initial)": [0], "reset": [1], "commit": [2]})
+        self.assertEqual(self._stamps(reloaded, op="reset"), [JAN_2024 + DAY])
+
+
+class QueryReflogTest(unittest.TestCase):
+    """
+    End-to-end reflog queries against a scratch repository.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        subprocess.run(["git", "init", "-q", self.tmp.name], check=True)
+        os.makedirs(os.path.join(self.tmp.name, ".git", "logs"), exist_ok=True)
+        with open(os.path.join(self.tmp.name, ".git", "logs", "HEAD"), "w", encoding="utf-8") as handle:
+            handle.writelines([
+                _line(0, JAN_2024, "commit (initial): a"),
+                _line(1, OLD, "commit (amend): a"),
+                _line(2, JAN_2024 + DAY, "commit: b"),
+            ])
+        os.chdir(self.tmp.name)
+        self.git = GitManager(Console(file=open(os.devnull, "w")))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.git.console.file.close()
+        self.tmp.cleanup()
+
+    def test_time_window_respects_out_of_order_entries(self):
+        since = self.git.query_reflog(since="2023-12-31", count=0)
+        self.assertEqual([m["selector"] for m in since], ["HEAD@{0}", "HEAD@{2}"])
+
+        until = self.git.query_reflog(until="2021-01-01", count=0)
+        self.assertEqual([m["selector"] for m in until], ["HEAD@{1}"])
+
+
+class SearchReflogTest(unittest.TestCase):
+    """
+    ``search_reflog`` outside a repository.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.env = mock.patch.dict(os.environ, {"GIT_CEILING_DIRECTORIES": os.path.dirname(self.tmp.name)})
+        self.env.start()
+        self.output = io.StringIO()
+        self.git = GitManager(Console(file=self.output, width=100, color_system=None))
+
+    def tearDown(self):
+        self.env.stop()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_branch_is_not_looked_up_outside_a_repository(self):
+        with mock.patch.object(self.git, "get_current_branch") as branch:
+            self.assertFalse(self.git.search_reflog(grep="x"))
+            self.assertFalse(self.git.search_reflog(grep="x", restore="1"))
+        branch.assert_not_called()
+        self.assertEqual(self.output.getvalue().count("Could not search reflog."), 2)
+
+
+class RestoreReflogTest(unittest.TestCase):
+    """
+    ``--restore`` only accepts entries from the displayed matches.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.env = mock.patch.dict(os.environ, {
+            "GIT_AUTHOR_NAME": "Test User", "GIT_AUTHOR_EMAIL": "test@example.com",
+            "GIT_COMMITTER_NAME": "Test User", "GIT_COMMITTER_EMAIL": "test@example.com",
+        })
+        self.env.start()
+        subprocess.run(["git", "init", "-q"], check=True)
+        for message in ("a", "b", "c"):
+            subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", message], check=True)
+        subprocess.run(["git", "reset", "-q", "--hard", "HEAD~1"], check=True)
+        # HEAD@{0} reset, HEAD@{1} commit: c, HEAD@{2} commit: b, HEAD@{3} commit (initial): a
+        self.head = self._rev("HEAD")
+        self.git = GitManager(Console(file=io.StringIO(), width=100, color_system=None))
+
+    def tearDown(self):
+        self.env.stop()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _rev(self, rev: str) -> str:
+        return subprocess.check_output(["git", "rev-parse", rev]).decode("utf-8").strip()
+
+    def _restore(self, restore: str) -> bool:
+        return self.git.search_reflog(grep="^commit: ", restore=restore)
+
+    def test_selector_number_of_a_match_is_restored(self):
+        target = self._rev("HEAD@{1}")
+        self.assertTrue(self._restore("1"))
+        self.assertEqual(self._rev("HEAD"), target)
+
+    def test_unique_hash_prefix_is_restored(self):
+        target = self._rev("HEAD@{1}")
+        self.assertTrue(self._restore(target[:7]))
+        self.assertEqual(self._rev("HEAD"), target)
+
+    def test_entries_outside_the_matches_are_refused(self):
+        for restore in ("0", "HEAD@{3}", self._rev("HEAD@{3}")[:7], "HEAD~1", "zzzz"):
+            self.assertFalse(self._restore(restore), restore)
+            self.assertEqual(self._rev("HEAD"), self.head, restore)
+        self.assertIn("is not one of the matched entries", self.git.console.file.getvalue())
+
+    def test_short_hash_prefix_is_refused(self):
+        self.assertFalse(self._restore(self._rev("HEAD@{1}")[:3]))
+        self.assertEqual(self._rev("HEAD"), self.head)
+
+
+if __name__ == "__main__":
+    unittest.main()
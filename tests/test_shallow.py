@@ -0,0 +1,137 @@
+import io
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from rich.console import Console
+
+from utils.git import GitManager
+
+IDENTITY_ENV = {
+    "GIT_AUTHOR_NAME": "Test User", "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User", "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def _make_source(path: str, commits: int) -> None:
+    """Create a repository with one new file per commit via fast-import."""
+    subprocess.run(["git", "init", "-q", path], check=True)
+    stream = []
+    for i in range(commits):
+        message, content = f"commit {i}", f"line {i}\n"
+        stream += [
+            "commit refs/heads/main",
+            f"author Test User <test@example.com> {1700000000 + i} +0000",
+            f"committer Test User <test@example.com> {1700000000 + i} +0000",
+            f"data {len(message)}", message,
+            f"M 644 inline file_{i:05d}.txt", f"data {len(content)}", content,
+        ]
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, check=True,
+                   input="\n".join(stream).encode("utf-8"))
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=path, check=True)
+    subprocess.run(["git", "config", "uploadpack.allowFilter", "true"], cwd=path, check=True)
+
+
+class CloneTestCase(unittest.TestCase):
+    """
+    Runs ``GitManager`` inside a file:// clone of a generated source repository.
+    """
+
+    COMMITS = 6
+
+    @classmethod
+    def setUpClass(cls):
+        cls.source_dir = tempfile.TemporaryDirectory()
+        cls.source = os.path.join(cls.source_dir.name, "source")
+        _make_source(cls.source, cls.COMMITS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.source_dir.cleanup()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        self.env = mock.patch.dict(os.environ, IDENTITY_ENV)
+        self.env.start()
+        self.output = io.StringIO()
+        self.git = GitManager(Console(file=self.output, width=100, color_system=None))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def clone(self, *options: str) -> str:
+        work = os.path.join(self.tmp.name, "work")
+        subprocess.run(["git", "clone", "-q", *options, f"file://{self.source}", work], check=True)
+        os.chdir(work)
+        return work
+
+    def git_output(self, *args: str) -> str:
+        return subprocess.check_output(["git", *args]).decode("utf-8").strip()
+
+
+class ShallowLogTest(CloneTestCase):
+    """
+    The shallow clone note in ``gli -l``.
+    """
+
+    COMMITS = 1500
+
+    def test_note_follows_early_pager_exit(self):
+        self.clone("--depth", "1000")
+        reader = f"{shlex.quote(sys.executable)} -c 'import sys; sys.stdin.readline()'"
+        with mock.patch.dict(os.environ, {"PAGER": reader}):
+            self.git.show_log(0, pager=True)
+        self.assertIn("Shallow clone: history ends at 1 boundary commit(s).", self.output.getvalue())
+
+
+class HistoryRewriteTest(CloneTestCase):
+    """
+    Author rewrites in shallow and partial clones.
+    """
+
+    def _change_author(self, *answers: str) -> bool:
+        with mock.patch("builtins.input", side_effect=list(answers)):
+            return self.git.change_commit_author()
+
+    def test_shallow_rewrite_leaves_boundary_unchanged(self):
+        self.clone("--depth", "3")
+        boundary = self.git_output("rev-parse", "HEAD~2")
+        self.assertEqual(self.git.get_shallow_commits(), [boundary])
+
+        self.assertTrue(self._change_author("3", "New Author", "new@example.com"))
+        self.assertEqual(self.git_output("rev-parse", "HEAD~2"), boundary)
+        self.assertEqual(self.git_output("log", "--format=%an").splitlines(),
+                         ["New Author", "New Author", "Test User"])
+        self.assertIn("1 boundary commit(s) left unchanged", self.output.getvalue())
+
+    def test_specific_scope_refuses_boundary_target(self):
+        self.clone("--depth", "3")
+        head = self.git_output("rev-parse", "HEAD")
+        boundary = self.git_output("rev-parse", "HEAD~2")
+
+        self.assertFalse(self._change_author("2", boundary[:12], "New Author", "new@example.com"))
+        self.assertEqual(self.git_output("rev-parse", "HEAD"), head)
+        self.assertIn("is at the shallow clone boundary", self.output.getvalue())
+
+    def test_partial_clone_prefetches_trees_in_one_request(self):
+        self.clone("--filter=tree:0")
+        trace = os.path.join(self.tmp.name, "trace")
+        with mock.patch.dict(os.environ, {"GIT_TRACE": trace}):
+            self.assertTrue(self._change_author("3", "New Author", "new@example.com"))
+
+        with open(trace, encoding="utf-8") as handle:
+            fetches = [line for line in handle if "built-in: git fetch" in line]
+        self.assertEqual(len(fetches), 1)
+        self.assertIn("--stdin", fetches[0])
+        self.assertEqual(set(self.git_output("log", "--format=%an").splitlines()), {"New Author"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,10 @@ from .core import GitCore
 from .actions import GitActions
 from .history import GitHistory
 from .log import GitLog
+from .reflog import GitReflog
+from .lock import GitLock, LockTimeout
 
-class GitManager(GitCore, GitActions, GitHistory, GitLog):
+class GitManager(GitCore, GitActions, GitHistory, GitLog, GitReflog):
     """
     Unified manager for all Git operations, composed of modular specialized classes.
     """
@@ -1,27 +1,22 @@
 import subprocess
 from rich.panel import Panel
 from rich import box
-from typing import Optional
+from typing import Optional, Tuple
 
 class GitActions:
     """
     Primary Git workflows: commit, push, branch management, and reset.
     """
 
-    def commit_and_push(self, message: str, path: str = ".", no_verify: bool = False) -> bool:
+    def _push_branch(self, branch: Optional[str], commit: Optional[str]) -> Tuple[bool, bool]:
         """
-        Stage changes, commit, and push. Automatically handles upstream tracking.
+        Push the current branch, coalescing with concurrent gli pushes.
+
+        Pushes are serialized; once a process holds the push lock it skips its
+        own push if an earlier push already carried ``commit`` to the upstream.
+        Returns ``(success, coalesced)``.
         """
-        with self.console.status("[bold green]Working on your commit...[/]"):
-            if not self.run_command(["add", path]): return False
-            
-            commit_cmd = ["commit", "-m", message]
-            if no_verify:
-                commit_cmd.append("--no-verify")
-                
-            if not self.run_command(commit_cmd): return False
-            
-            branch = self.get_current_branch()
+        with self.operation_lock("push"):
             has_upstream = False
             if branch:
                 try:
@@ -30,15 +25,41 @@ class GitActions:
                 except subprocess.CalledProcessError:
                     has_upstream = False
 
+            if has_upstream and commit:
+                included = subprocess.run(["git", "merge-base", "--is-ancestor", commit, "@{u}"], capture_output=True)
+                if included.returncode == 0:
+                    return True, True
+
             if has_upstream:
-                push_success = self.run_command(["push"])
-            else:
-                push_success = self.run_command(["push", "--set-upstream", "origin", branch])
+                return self.run_command(["push"]), False
+            return self.run_command(["push", "--set-upstream", "origin", branch]), False
+
+    def commit_and_push(self, message: str, path: str = ".", no_verify: bool = False) -> bool:
+        """
+        Stage changes, commit, and push. Automatically handles upstream tracking.
+        """
+        with self.console.status("[bold green]Working on your commit...[/]"):
+            with self.operation_lock():
+                if not self.run_command(["add", path]): return False
+                
+                commit_cmd = ["commit", "-m", message]
+                if no_verify:
+                    commit_cmd.append("--no-verify")
+                    
+                if not self.run_command(commit_cmd): return False
+                
+                branch = self.get_current_branch()
+                try:
+                    commit = subprocess.check_output(["git", "rev-parse", "HEAD"]).decode("utf-8").strip()
+                except subprocess.CalledProcessError:
+                    commit = None
 
+            push_success, coalesced = self._push_branch(branch, commit)
             if not push_success: return False
         
+        status = "Pushed to Remote (with a concurrent push)" if coalesced else "Pushed to Remote"
         self.console.print(Panel(
-            f"Message: [bold white]{message}[/]\nStatus: [bold green]Pushed to Remote[/]",
+            f"Message: [bold white]{message}[/]\nStatus: [bold green]{status}[/]",
             title="Commit & Push", border_style="green", box=box.ROUNDED
         ))
         return True
@@ -51,7 +72,7 @@ class GitActions:
             self.console.print("[bold red]Error:[/] Invalid mode.")
             return False
             
-        with self.console.status(f"[bold red]Resetting: {mode}...[/]"):
+        with self.console.status(f"[bold red]Resetting: {mode}...[/]"), self.operation_lock():
             success = self.run_command(["reset", f"--{mode}", "HEAD~1"])
         
         if success:
@@ -66,11 +87,13 @@ class GitActions:
         Create a new branch and switch to it. Optionally push to origin.
         """
         with self.console.status(f"[bold blue]Switching to {name}...[/]"):
-            if not self.run_command(["checkout", "-b", name]):
-                return False
+            with self.operation_lock():
+                if not self.run_command(["checkout", "-b", name]):
+                    return False
             
             if push_to_remote:
-                push_success = self.run_command(["push", "-u", "origin", name])
+                with self.operation_lock("push"):
+                    push_success = self.run_command(["push", "-u", "origin", name])
                 status_msg = "Tracking origin."
             else:
                 push_success = True
@@ -1,12 +1,26 @@
 import subprocess
 import os
+import random
+import re
+import time
+from contextlib import nullcontext
 from rich.console import Console
-from typing import Optional, List, Dict
+from typing import ContextManager, Optional, List, Dict
+from .lock import GitLock
+
+# Honoured by Git 2.44+: fail instead of faulting in missing objects from a promisor remote.
+NO_LAZY_FETCH_ENV = {"GIT_NO_LAZY_FETCH": "1"}
 
 class GitCore:
     """
     Foundation for Git operations and configuration retrieval.
     """
+
+    LOCK_TIMEOUT = 600.0
+    RETRY_ATTEMPTS = 6
+    RETRY_BASE_DELAY = 0.1
+    RETRY_MAX_DELAY = 2.0
+    LOCK_BUSY_PATTERN = re.compile(r"Unable to create '[^']*\.lock': File exists|cannot lock ref '[^']*': is at \w+ but expected \w+")
     
     def __init__(self, console: Optional[Console] = None):
         """Initialize with a Rich console instance."""
@@ -21,6 +35,27 @@ class GitCore:
         except subprocess.CalledProcessError:
             return None
 
+    def get_git_dir(self, common: bool = False) -> Optional[str]:
+        """
+        Retrieve the absolute path of the Git directory (or the common directory shared by worktrees).
+        """
+        flag = "--git-common-dir" if common else "--git-dir"
+        try:
+            return os.path.abspath(subprocess.check_output(["git", "rev-parse", flag], stderr=subprocess.DEVNULL).decode("utf-8").strip())
+        except subprocess.CalledProcessError:
+            return None
+
+    def operation_lock(self, name: str = "operation") -> ContextManager:
+        """
+        Advisory lock serializing gli operations across processes sharing this repository.
+
+        Outside a repository nothing is locked, so Git reports the error itself.
+        """
+        git_dir = self.get_git_dir(common=True)
+        if not git_dir:
+            return nullcontext()
+        return GitLock(os.path.join(git_dir, "gli"), name, timeout=self.LOCK_TIMEOUT)
+
     def get_github_username(self) -> str:
         """
         Attempt to detect the GitHub username from Git configuration.
@@ -59,18 +94,63 @@ class GitCore:
         except subprocess.CalledProcessError:
             return None
 
-    def run_command(self, args: List[str], env: Optional[Dict[str, str]] = None) -> bool:
+    def is_shallow_repository(self) -> bool:
         """
-        Execute a Git command with optional environment variable overrides.
+        Check whether the repository is a shallow clone.
+        """
+        try:
+            return subprocess.check_output(["git", "rev-parse", "--is-shallow-repository"]).decode("utf-8").strip() == "true"
+        except subprocess.CalledProcessError:
+            return False
+
+    def get_shallow_commits(self) -> List[str]:
+        """
+        Retrieve the boundary commits of a shallow clone, whose parents are not present.
+        """
+        try:
+            path = subprocess.check_output(["git", "rev-parse", "--git-path", "shallow"]).decode("utf-8").strip()
+            with open(path, encoding="utf-8") as handle:
+                return [line.strip() for line in handle if line.strip()]
+        except (subprocess.CalledProcessError, OSError):
+            return []
+
+    def get_promisor_remote(self) -> Optional[str]:
+        """
+        Retrieve the promisor remote of a partial clone, if any.
+        """
+        remote = self.get_config("extensions.partialClone")
+        if remote:
+            return remote
+        try:
+            output = subprocess.check_output(["git", "config", "--get-regexp", r"^remote\..*\.promisor$"]).decode("utf-8")
+        except subprocess.CalledProcessError:
+            return None
+        for line in output.splitlines():
+            key, _, value = line.partition(" ")
+            if value.strip() == "true":
+                return key[len("remote."):-len(".promisor")]
+        return None
+
+    def run_command(self, args: List[str], env: Optional[Dict[str, str]] = None, input: Optional[str] = None) -> bool:
+        """
+        Execute a Git command with optional environment variable overrides and standard input.
+
+        Failures caused by a busy ``index.lock`` or ref lock are retried with
+        jittered exponential backoff before being reported.
         """
         current_env = os.environ.copy()
         current_env["FILTER_BRANCH_SQUELCH_WARNING"] = "1"
         if env:
             current_env.update(env)
         
-        try:
-            subprocess.run(["git"] + args, capture_output=True, text=True, check=True, env=current_env)
-            return True
-        except subprocess.CalledProcessError as e:
-            self.console.print(f"[bold red]✗ Error:[/] {e.stderr.strip()}")
-            return False
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                subprocess.run(["git"] + args, input=input, capture_output=True, text=True, check=True, env=current_env)
+                return True
+            except subprocess.CalledProcessError as e:
+                if attempt + 1 < self.RETRY_ATTEMPTS and self.LOCK_BUSY_PATTERN.search(e.stderr):
+                    delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+                    time.sleep(delay * random.uniform(0.5, 1.5))
+                    continue
+                self.console.print(f"[bold red]✗ Error:[/] {(e.stderr or e.stdout).strip()}")
+                return False
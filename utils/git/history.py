@@ -1,6 +1,9 @@
+import os
+import subprocess
 from rich.panel import Panel
 from rich import box
-from typing import Optional
+from typing import List, Optional
+from .core import NO_LAZY_FETCH_ENV
 
 class GitHistory:
     """
@@ -24,6 +27,64 @@ class GitHistory:
         if choice == "3": return "all"
         return "single"
 
+    def _rewrite_revisions(self, scope: str, target_hash: str = "") -> Optional[List[str]]:
+        """
+        Limit a filter-branch rewrite to the commits it must touch.
+
+        Shallow boundary commits are excluded so their missing parents are never
+        needed, and a specific target only rewrites itself and its descendants.
+        """
+        boundary = self.get_shallow_commits()
+        excludes = [f"^{commit}" for commit in boundary]
+        if scope != "specific":
+            if boundary:
+                self.console.print(f"[bold yellow]⚠ Info:[/] Shallow clone: {len(boundary)} boundary commit(s) left unchanged.")
+            return ["HEAD"] + excludes
+
+        try:
+            output = subprocess.check_output(
+                ["git", "rev-list", "--parents", "-n", "1", f"{target_hash}^{{commit}}"], stderr=subprocess.DEVNULL
+            ).decode("utf-8").split()
+        except subprocess.CalledProcessError:
+            self.console.print(f"[bold red]✗ Error:[/] Unknown commit '{target_hash}'.")
+            return None
+
+        target, parents = output[0], output[1:]
+        if target in boundary:
+            self.console.print(
+                f"[bold red]✗ Error:[/] Commit {target[:7]} is at the shallow clone boundary; "
+                "deepen history first (git fetch --deepen=N)."
+            )
+            return None
+        return ["HEAD"] + [f"^{parent}" for parent in parents] + excludes
+
+    def _prefetch_rewrite_objects(self, revisions: List[str]) -> bool:
+        """
+        In a partial clone, fetch the root trees a rewrite needs in a single request.
+
+        filter-branch would otherwise fault them in one object at a time.
+        """
+        remote = self.get_promisor_remote()
+        if not remote:
+            return True
+
+        try:
+            output = subprocess.check_output(
+                ["git", "rev-list", "--objects", "--missing=print", "--filter=tree:1"] + revisions,
+                stderr=subprocess.DEVNULL, env={**os.environ, **NO_LAZY_FETCH_ENV}
+            ).decode("utf-8")
+        except subprocess.CalledProcessError:
+            return True
+
+        missing = [line[1:] for line in output.splitlines() if line.startswith("?")]
+        if not missing:
+            return True
+        return self.run_command(
+            ["-c", "fetch.negotiationAlgorithm=noop", "fetch", remote, "--no-tags", "--no-write-fetch-head",
+             "--recurse-submodules=no", "--filter=blob:none", "--stdin"],
+            input="\n".join(missing) + "\n"
+        )
+
     def change_commit_time(self, date_str: Optional[str] = None) -> bool:
         """
         Update the timestamp for one or more commits.
@@ -44,15 +105,21 @@ class GitHistory:
             if scope == "specific":
                 filter_script = f"case \"$GIT_COMMIT\" in {target_hash}*) {filter_script} ;; esac"
             
-            cmd = ["filter-branch", "-f", "--env-filter", filter_script, "--", "HEAD"]
+            revisions = self._rewrite_revisions(scope, target_hash)
+            if revisions is None:
+                return False
+
+            cmd = ["filter-branch", "-f", "--env-filter", filter_script, "--"] + revisions
+            env = NO_LAZY_FETCH_ENV
             status_msg = "[bold yellow]Rewriting history...[/]"
         else:
+            revisions = None
             env = {"GIT_AUTHOR_DATE": date_str, "GIT_COMMITTER_DATE": date_str}
             cmd = ["commit", "--amend", "--no-edit", "--date", date_str]
             status_msg = f"[bold yellow]Updating last commit to {date_str}...[/]"
 
-        with self.console.status(status_msg):
-            success = self.run_command(cmd, env=None if scope in ["all", "specific"] else env)
+        with self.console.status(status_msg), self.operation_lock():
+            success = (revisions is None or self._prefetch_rewrite_objects(revisions)) and self.run_command(cmd, env=env)
         
         if success:
             detail = f"Target: [bold]{target_hash if scope == 'specific' else scope.capitalize()}[/]"
@@ -81,14 +148,21 @@ class GitHistory:
             if scope == "specific":
                 filter_script = f"case \"$GIT_COMMIT\" in {target_hash}*) {filter_script} ;; esac"
                 
-            cmd = ["filter-branch", "-f", "--env-filter", filter_script, "--", "HEAD"]
+            revisions = self._rewrite_revisions(scope, target_hash)
+            if revisions is None:
+                return False
+
+            cmd = ["filter-branch", "-f", "--env-filter", filter_script, "--"] + revisions
+            env = NO_LAZY_FETCH_ENV
             status_msg = "[bold yellow]Rewriting author in history...[/]"
         else:
+            revisions = None
+            env = None
             cmd = ["commit", "--amend", "--no-edit", f"--author={author_str}"]
             status_msg = f"[bold yellow]Changing last commit identity...[/]"
 
-        with self.console.status(status_msg):
-            success = self.run_command(cmd)
+        with self.console.status(status_msg), self.operation_lock():
+            success = (revisions is None or self._prefetch_rewrite_objects(revisions)) and self.run_command(cmd, env=env)
         
         if success:
             detail = f"Target: [bold]{target_hash if scope == 'specific' else scope.capitalize()}[/]"
@@ -105,7 +179,7 @@ class GitHistory:
         self.console.print("[bold green]Message Rewriter[/]")
         new_msg = input("\x01\033[1;37m\x02Enter new commit message: \x01\033[0m\x02").strip()
 
-        with self.console.status("[bold green]Updating message...[/]"):
+        with self.console.status("[bold green]Updating message...[/]"), self.operation_lock():
             success = self.run_command(["commit", "--amend", "-m", new_msg])
         
         if success:
@@ -0,0 +1,169 @@
+import os
+import random
+import time
+from typing import Dict, IO, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class LockTimeout(TimeoutError):
+    """
+    Raised when a gli lock could not be acquired within its timeout.
+    """
+
+
+def _try_lock(handle: IO) -> bool:
+    """Take a non-blocking exclusive lock on an open file."""
+    try:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(handle: IO) -> None:
+    try:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+class GitLock:
+    """
+    Advisory, reentrant inter-process lock for gli operations on one repository.
+
+    Waiters queue up as ticket files ordered by arrival, each held locked by its
+    owner, so the lock is granted first come, first served and tickets left
+    behind by crashed processes are detected and pruned. Mutual exclusion itself
+    is enforced by an exclusive lock on ``<name>.lock``.
+    """
+
+    POLL_INTERVAL = 0.05
+    _held: Dict[str, list] = {}
+
+    def __init__(self, directory: str, name: str = "operation", timeout: float = 600.0):
+        self.path = os.path.join(directory, f"{name}.lock")
+        self.queue = os.path.join(directory, f"{name}.queue")
+        self.name = name
+        self.timeout = timeout
+        self._ticket: Optional[str] = None
+
+    def _is_stale(self, ticket: str) -> bool:
+        """A ticket is stale when nobody holds its file lock any more."""
+        try:
+            with open(ticket, "a") as handle:
+                if not _try_lock(handle):
+                    return False
+                _unlock(handle)
+            return True
+        except OSError:
+            return False
+
+    def _head_of_queue(self) -> bool:
+        """
+        Return True when no live ticket is ahead of ours, pruning stale ones on the way.
+        """
+        mine = os.path.basename(self._ticket)
+        for name in sorted(os.listdir(self.queue)):
+            if name >= mine:
+                return True
+            ticket = os.path.join(self.queue, name)
+            if not self._is_stale(ticket):
+                return False
+            try:
+                os.remove(ticket)
+            except OSError:
+                pass
+        return True
+
+    def _enqueue(self, deadline: float) -> IO:
+        """
+        Create our ticket already locked, so other waiters never see it as stale.
+
+        On POSIX the ticket is locked under a private name and renamed into the
+        queue. Windows cannot rename an open file, but it also refuses to delete
+        one, so there the ticket is created in place and locked until that succeeds.
+        """
+        os.makedirs(self.queue, exist_ok=True)
+        name = f"{time.time_ns():020d}-{os.getpid()}-{random.getrandbits(32):08x}"
+        self._ticket = os.path.join(self.queue, name)
+
+        if fcntl:
+            staging = os.path.join(os.path.dirname(self.queue), f".{self.name}.{name}.tmp")
+            handle = open(staging, "w")
+            _try_lock(handle)
+            os.rename(staging, self._ticket)
+            return handle
+
+        handle = open(self._ticket, "w")
+        while not _try_lock(handle):
+            if time.monotonic() >= deadline:
+                self._discard_ticket(handle)
+                raise LockTimeout(f"Timed out after {self.timeout:g}s queueing for the gli lock ({self.name}).")
+            time.sleep(self.POLL_INTERVAL * random.uniform(0.5, 1.5))
+        return handle
+
+    def acquire(self) -> None:
+        """
+        Wait in the queue and take the lock, raising ``LockTimeout`` after ``timeout`` seconds.
+        """
+        held = self._held.get(self.path)
+        if held:
+            held[1] += 1
+            return
+
+        deadline = time.monotonic() + self.timeout
+        ticket_handle = self._enqueue(deadline)
+        lock_handle = open(self.path, "a")
+
+        try:
+            while not (self._head_of_queue() and _try_lock(lock_handle)):
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"Timed out after {self.timeout:g}s waiting for another gli process ({self.name}).")
+                time.sleep(self.POLL_INTERVAL * random.uniform(0.5, 1.5))
+        except BaseException:
+            lock_handle.close()
+            self._discard_ticket(ticket_handle)
+            raise
+
+        self._held[self.path] = [lock_handle, 1, ticket_handle, self._ticket]
+
+    def _discard_ticket(self, handle: IO) -> None:
+        _unlock(handle)
+        handle.close()
+        try:
+            os.remove(self._ticket)
+        except OSError:
+            pass
+
+    def release(self) -> None:
+        """Release one level of the lock, freeing it when the outermost holder exits."""
+        held = self._held.get(self.path)
+        if not held:
+            return
+        held[1] -= 1
+        if held[1]:
+            return
+
+        lock_handle, _, ticket_handle, self._ticket = self._held.pop(self.path)
+        _unlock(lock_handle)
+        lock_handle.close()
+        self._discard_ticket(ticket_handle)
+
+    def __enter__(self) -> "GitLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
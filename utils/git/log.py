@@ -1,56 +1,80 @@
+import os
 import subprocess
-from rich.table import Table
-from rich import box
+from contextlib import closing
+from typing import Iterator, List
+from components.log_view import LogView
+from .core import NO_LAZY_FETCH_ENV
+
+FIELD_SEP = "\x1f"
 
 class GitLog:
     """
     Visualization tools for Git history: log and reflog.
     """
 
-    def show_log(self, count: int = 10):
+    LOG_COLUMNS = [
+        ("Hash", "dim green", "left", 0),
+        ("Date & Time", "green", "left", 0),
+        ("Author", "yellow", "left", 24),
+        ("Message", "white", "left", 0),
+    ]
+
+    REFLOG_COLUMNS = [
+        ("Index", "dim white", "right", 0),
+        ("Hash", "dim magenta", "left", 0),
+        ("Time", "green", "left", 0),
+        ("Operation", "white", "left", 0),
+    ]
+
+    def _stream_rows(self, args: List[str]) -> Iterator[List[str]]:
+        """
+        Yield ``FIELD_SEP``-delimited rows from a Git command as it produces them.
+        """
+        process = subprocess.Popen(
+            ["git"] + args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", errors="replace", env={**os.environ, **NO_LAZY_FETCH_ENV}
+        )
+        try:
+            for line in process.stdout:
+                if FIELD_SEP in line:
+                    yield line.rstrip("\n").split(FIELD_SEP)
+            if process.wait() != 0:
+                raise subprocess.CalledProcessError(process.returncode, args)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+    def show_log(self, count: int = 10, pager: bool = False):
         """
-        Retrieve and render the commit history in a formatted Rich table.
+        Stream the commit history into a table. A count of 0 shows the full history.
         """
+        args = ["log", f"--pretty=format:%h{FIELD_SEP}%ad{FIELD_SEP}%an{FIELD_SEP}%s", "--date=format:%Y-%m-%d %H:%M"]
+        if count:
+            args[1:1] = ["-n", str(count)]
+
         try:
-            result = subprocess.run(
-                ["git", "log", f"-n", str(count), "--pretty=format:%h|%ad|%an|%s", "--date=format:%Y-%m-%d %H:%M"],
-                capture_output=True, text=True, check=True
-            )
-            
-            table = Table(title="Git History", box=box.ROUNDED, border_style="green")
-            table.add_column("Hash", style="dim green", no_wrap=True)
-            table.add_column("Date & Time", style="green")
-            table.add_column("Author", style="yellow")
-            table.add_column("Message", style="white")
-
-            for line in result.stdout.strip().split("\n"):
-                if "|" in line:
-                    table.add_row(*line.split("|"))
-            
-            self.console.print(table)
+            with closing(self._stream_rows(args)) as rows:
+                shown = LogView(self.console).render("Git History", self.LOG_COLUMNS, rows, border_style="green", pager=pager)
         except Exception:
             self.console.print("[bold red]Error:[/] Could not fetch log.")
+            return
 
-    def show_reflog(self, count: int = 10):
+        if (not count or shown < count) and self.is_shallow_repository():
+            self.console.print(f"[bold yellow]⚠ Info:[/] Shallow clone: history ends at {len(self.get_shallow_commits())} boundary commit(s).")
+
+    def show_reflog(self, count: int = 10, pager: bool = False):
         """
-        Retrieve and render the Git reflog in a formatted Rich table.
+        Stream the Git reflog into a table. A count of 0 shows every entry.
         """
+        args = ["reflog", f"--pretty=format:%h{FIELD_SEP}%ad{FIELD_SEP}%gs", "--date=format:%Y-%m-%d %H:%M"]
+        if count:
+            args[1:1] = ["-n", str(count)]
+
         try:
-            result = subprocess.run(
-                ["git", "reflog", f"-n", str(count), "--pretty=format:%h|%ad|%gs", "--date=format:%Y-%m-%d %H:%M"],
-                capture_output=True, text=True, check=True
-            )
-            
-            table = Table(title="Reflog (Recovery)", box=box.ROUNDED, border_style="magenta")
-            table.add_column("Index", style="dim white", justify="right")
-            table.add_column("Hash", style="dim magenta", no_wrap=True)
-            table.add_column("Time", style="green")
-            table.add_column("Operation", style="white")
-
-            for i, line in enumerate(result.stdout.strip().split("\n")):
-                if "|" in line:
-                    table.add_row(f"HEAD@{{{i}}}", *line.split("|"))
-            
-            self.console.print(table)
+            with closing(self._stream_rows(args)) as rows:
+                indexed = ([f"HEAD@{{{i}}}"] + row for i, row in enumerate(rows))
+                LogView(self.console).render("Reflog (Recovery)", self.REFLOG_COLUMNS, indexed, border_style="magenta", pager=pager)
         except Exception:
             self.console.print("[bold red]Error:[/] Could not fetch reflog.")
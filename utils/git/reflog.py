@@ -0,0 +1,304 @@
+import json
+import os
+import re
+import subprocess
+import time
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+from rich.panel import Panel
+from rich import box
+from components.log_view import LogView
+
+INDEX_VERSION = 2
+
+class ReflogIndex:
+    """
+    Incremental offset index over raw reflog files (``logs/HEAD``, ``logs/refs/heads/*``).
+
+    For every entry the index keeps only ``[timestamp, byte offset, op id, ordinal]``,
+    sorted by timestamp, plus per-operation postings (positions in that order), both
+    persisted. New lines appended since the last run are parsed from the stored
+    offset; truncated or rewritten logs are re-indexed from scratch.
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.logs: Dict[str, Dict] = {}
+        self._dirty = False
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if data.get("version") == INDEX_VERSION:
+                    self.logs = data.get("logs", {})
+            except (OSError, ValueError):
+                self.logs = {}
+
+    @staticmethod
+    def parse_line(line: bytes) -> Optional[Tuple[str, str, str, int, str]]:
+        """
+        Split a raw reflog line into ``(old, new, identity, timestamp, message)``.
+        """
+        header, _, message = line.decode("utf-8", errors="replace").rstrip("\n").partition("\t")
+        try:
+            prefix, ts, _tz = header.rsplit(" ", 2)
+            old, new, identity = prefix.split(" ", 2)
+            return old, new, identity, int(ts), message
+        except ValueError:
+            return None
+
+    @staticmethod
+    def operation(message: str) -> str:
+        """Return the operation label of a reflog message, e.g. ``reset`` or ``commit (amend)``."""
+        label, sep, _ = message.partition(":")
+        return label.strip() if sep and label.strip() else "other"
+
+    def _fingerprint(self, path: str) -> str:
+        with open(path, "rb") as handle:
+            return handle.readline().decode("utf-8", errors="replace")
+
+    def refresh(self, name: str, path: str) -> None:
+        """
+        Bring the index for one reflog file up to date, reading only appended bytes.
+        """
+        size = os.path.getsize(path)
+        state = self.logs.get(name)
+        if state and (size < state["size"] or self._fingerprint(path) != state["fingerprint"]):
+            state = None
+        if state is None:
+            state = {"size": 0, "fingerprint": "", "ops": [], "entries": [], "postings": [], "count": 0}
+            self.logs[name] = state
+            self._dirty = True
+        if size == state["size"]:
+            return
+
+        ops = {op: i for i, op in enumerate(state["ops"])}
+        new_entries = []
+        with open(path, "rb") as handle:
+            handle.seek(state["size"])
+            offset = state["size"]
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                parsed = self.parse_line(line)
+                if parsed:
+                    op = self.operation(parsed[4])
+                    if op not in ops:
+                        ops[op] = len(state["ops"])
+                        state["ops"].append(op)
+                        state["postings"].append([])
+                    new_entries.append([parsed[3], offset, ops[op], state["count"]])
+                    state["count"] += 1
+                offset += len(line)
+
+        # Reflog timestamps follow the committer date, which amends and rebases
+        # can set arbitrarily, so file order is not time order.
+        entries = state["entries"]
+        new_entries.sort()
+        if entries and new_entries and new_entries[0][0] < entries[-1][0]:
+            entries.extend(new_entries)
+            entries.sort()
+            state["postings"] = [[] for _ in state["ops"]]
+            for position, entry in enumerate(entries):
+                state["postings"][entry[2]].append(position)
+        else:
+            for position, entry in enumerate(new_entries, start=len(entries)):
+                state["postings"][entry[2]].append(position)
+            entries.extend(new_entries)
+        if not state["fingerprint"]:
+            state["fingerprint"] = self._fingerprint(path)
+        state["size"] = offset
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the index if it changed, replacing the previous file atomically."""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump({"version": INDEX_VERSION, "logs": self.logs}, handle, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+        self._dirty = False
+
+    def candidates(self, name: str, since: Optional[int] = None, until: Optional[int] = None,
+                   op: Optional[str] = None) -> Iterator[List[int]]:
+        """
+        Yield index entries newest first, restricted to a time window and operation.
+
+        The window is located by bisection and operations by their postings, so
+        only matching entries are visited.
+        """
+        state = self.logs.get(name)
+        if not state:
+            return
+        entries = state["entries"]
+        lo = bisect_left(entries, [since]) if since is not None else 0
+        hi = bisect_left(entries, [until + 1]) if until is not None else len(entries)
+
+        if op is None:
+            for position in range(hi - 1, lo - 1, -1):
+                yield entries[position]
+            return
+
+        wanted = op.lower()
+        op_ids = [i for i, label in enumerate(state["ops"])
+                  if label.lower() == wanted or label.lower().split(" ")[0] == wanted]
+        ranges = []
+        for op_id in op_ids:
+            positions = state["postings"][op_id]
+            ranges.append((positions, bisect_left(positions, lo), bisect_left(positions, hi)))
+
+        cursors = [end - 1 for _, _, end in ranges]
+        while True:
+            best = -1
+            for k, (positions, start, _) in enumerate(ranges):
+                if cursors[k] >= start and (best < 0 or positions[cursors[k]] > ranges[best][0][cursors[best]]):
+                    best = k
+            if best < 0:
+                return
+            yield entries[ranges[best][0][cursors[best]]]
+            cursors[best] -= 1
+
+
+class GitReflog:
+    """
+    Indexed reflog search and one-step recovery.
+    """
+
+    MIN_HASH_PREFIX = 4
+
+    def _reflog_file(self, ref: str) -> Tuple[str, str]:
+        """
+        Map ``HEAD`` or a branch name to its reflog key and file path.
+        """
+        if ref == "HEAD":
+            return "HEAD", os.path.join(self.get_git_dir(), "logs", "HEAD")
+        name = ref if ref.startswith("refs/") else f"refs/heads/{ref}"
+        return name, os.path.join(self.get_git_dir(common=True), "logs", *name.split("/"))
+
+    def _parse_time(self, value: Optional[str], flag: str) -> Optional[int]:
+        """
+        Convert a date expression to a Unix timestamp using Git's own date parser.
+        """
+        if not value:
+            return None
+        output = subprocess.check_output(["git", "rev-parse", f"{flag}={value}"]).decode("utf-8").strip()
+        return int(output.split("=", 1)[1])
+
+    def query_reflog(self, ref: str = "HEAD", grep: Optional[str] = None, since: Optional[str] = None,
+                     until: Optional[str] = None, op: Optional[str] = None, count: int = 10) -> List[Dict[str, str]]:
+        """
+        Return reflog entries matching the filters, newest first. A count of 0 returns every match.
+        """
+        git_dir = self.get_git_dir()
+        if not git_dir:
+            raise RuntimeError("Not a git repository.")
+        name, path = self._reflog_file(ref)
+        if not os.path.exists(path):
+            return []
+
+        index = ReflogIndex(os.path.join(git_dir, "gli", "reflog-index.json"))
+        index.refresh(name, path)
+        index.save()
+
+        pattern = re.compile(grep, re.IGNORECASE) if grep else None
+        total = index.logs[name]["count"]
+        label = "HEAD" if name == "HEAD" else name.split("/", 2)[-1]
+        matches = []
+        with open(path, "rb") as handle:
+            for ts, offset, _, ordinal in index.candidates(name, self._parse_time(since, "--since"),
+                                                           self._parse_time(until, "--until"), op):
+                handle.seek(offset)
+                parsed = ReflogIndex.parse_line(handle.readline())
+                if not parsed or (pattern and not pattern.search(parsed[4])):
+                    continue
+                matches.append({
+                    "selector": f"{label}@{{{total - 1 - ordinal}}}",
+                    "hash": parsed[1],
+                    "time": time.strftime("%Y-%m-%d %H:%M", time.localtime(ts)),
+                    "message": parsed[4],
+                })
+                if count and len(matches) >= count:
+                    break
+        return matches
+
+    def search_reflog(self, ref: str = "HEAD", grep: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, op: Optional[str] = None, count: int = 10,
+                      restore: Optional[str] = None, pager: bool = False) -> bool:
+        """
+        Render filtered reflog entries and optionally restore one of them.
+        """
+        try:
+            matches = self.query_reflog(ref, grep, since, until, op, count)
+        except re.error as e:
+            self.console.print(f"[bold red]✗ Error:[/] Invalid pattern: {e}")
+            return False
+        except (RuntimeError, subprocess.CalledProcessError, OSError):
+            self.console.print("[bold red]Error:[/] Could not search reflog.")
+            return False
+
+        if restore:
+            branch = self.get_current_branch()
+            if ref not in ("HEAD", branch, f"refs/heads/{branch}"):
+                self.console.print(
+                    f"[bold red]✗ Error:[/] --restore only applies to HEAD or the current branch ({branch}), not '{ref}'."
+                )
+                return False
+
+        if not matches:
+            self.console.print("[bold yellow]⚠ Info:[/] No reflog entries matched.")
+            return False
+
+        rows = ([m["selector"], m["hash"][:7], m["time"], m["message"]] for m in matches)
+        LogView(self.console).render("Reflog Search", self.REFLOG_COLUMNS, rows, border_style="magenta", pager=pager)
+
+        if restore == "prompt":
+            restore = input("\x01\033[1;37m\x02Restore entry (selector, blank to skip): \x01\033[0m\x02").strip()
+        if not restore:
+            return True
+
+        selected = self._select_match(matches, restore)
+        return bool(selected) and self.restore_reflog_entry(selected["hash"])
+
+    def _select_match(self, matches: List[Dict[str, str]], restore: str) -> Optional[Dict[str, str]]:
+        """
+        Resolve a ``--restore`` argument to one of the displayed matches.
+
+        Accepts a selector (``HEAD@{2}``), its bare number, or a hash prefix of at
+        least ``MIN_HASH_PREFIX`` characters that identifies a single commit.
+        """
+        if restore.isdigit():
+            restore = f"{matches[0]['selector'].split('@')[0]}@{{{restore}}}"
+        selected = next((m for m in matches if m["selector"] == restore), None)
+        if selected:
+            return selected
+
+        if len(restore) >= self.MIN_HASH_PREFIX:
+            prefix = restore.lower()
+            candidates = [m for m in matches if m["hash"].startswith(prefix)]
+            if len({m["hash"] for m in candidates}) == 1:
+                return candidates[0]
+            if candidates:
+                self.console.print(f"[bold red]✗ Error:[/] '{restore}' matches several entries; use a longer hash or a selector.")
+                return None
+        elif re.fullmatch(r"[0-9a-fA-F]+", restore):
+            self.console.print(f"[bold red]✗ Error:[/] Hash prefixes need at least {self.MIN_HASH_PREFIX} characters.")
+            return None
+
+        self.console.print(f"[bold red]✗ Error:[/] '{restore}' is not one of the matched entries.")
+        return None
+
+    def restore_reflog_entry(self, target: str) -> bool:
+        """
+        Move the current branch to a reflog entry, keeping uncommitted changes where possible.
+        """
+        with self.console.status(f"[bold magenta]Restoring {target}...[/]"), self.operation_lock():
+            success = self.run_command(["reset", "--keep", target])
+
+        if success:
+            self.console.print(Panel(
+                f"Restored to [bold]{target}[/] using [bold magenta]keep[/] mode.",
+                title="Reflog Restore", border_style="magenta", box=box.ROUNDED
+            ))
+        return success